@@ -3,21 +3,169 @@ warnings.filterwarnings("ignore", category=UserWarning)
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import math
-import time
-import threading
-from PIL import Image, ImageTk, ImageOps
+from PIL import Image, ImageTk, ImageOps, ImageDraw, ImageFont
+import numpy as np
 import os
 import csv
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
+from functools import lru_cache
 import random
 from datetime import datetime, timedelta
 import io
+import weakref
 import pygame  # Added for background music
 
+HALF_PI = math.pi / 2
 
-class Planet:
+CONTROLS_TEXT = """
+    SOLAR SYSTEM EXPLORER - CONTROLS
+
+    🖱️ MOUSE CONTROLS:
+    • Left Click + Drag: Pan the view
+    • Mouse Wheel: Zoom in/out
+    • Click on Planet: Select and show info
+
+    ⌨️ KEYBOARD SHORTCUTS:
+    • Escape: Exit fullscreen mode
+
+    🎮 INTERFACE CONTROLS:
+    • Start/Pause: Control animation
+    • Reset: Reset view and positions
+    • Time Speed: Control animation speed
+    • Zoom In/Out: Adjust view scale
+
+    🔧 VIEW OPTIONS:
+    • Show Orbits: Toggle orbital paths
+    • Show Names: Toggle planet labels
+    • Show Moons: Toggle moon visibility
+    • 3D View: Enable 3D perspective
+
+    🎵 MUSIC CONTROLS:
+    • Load Music: Add background music
+    • Volume: Adjust music volume
+    • Music ON/OFF: Toggle playback
+
+    📊 PLANET INFO:
+    • Select planet from dropdown
+    • Click "Detailed Info" for full data
+    • Click directly on planets for quick info
+        """
+
+ABOUT_PLANETS_TEXT = """
+    🌌 ABOUT OUR SOLAR SYSTEM
+
+    Our solar system consists of the Sun and all celestial objects that orbit it, including planets, moons, asteroids, and comets.
+
+    🪐 THE PLANETS:
+
+    INNER PLANETS (Rocky):
+    • Mercury: Closest to Sun, extreme temperatures
+    • Venus: Hottest planet, thick toxic atmosphere
+    • Earth: Our home, the only known planet with life
+    • Mars: The Red Planet, largest volcano in solar system
+
+    OUTER PLANETS (Gas/Ice Giants):
+    • Jupiter: Largest planet, Great Red Spot storm
+    • Saturn: Famous rings, less dense than water
+    • Uranus: Tilted on its side, ice giant
+    • Neptune: Windiest planet, deep blue color
+
+    🌙 MOONS:
+    Our solar system has over 200 known moons, from tiny asteroids to bodies larger than Mercury.
+
+    ⭐ INTERESTING FACTS:
+    • The Sun contains 99.86% of the solar system's mass
+    • Jupiter has more than 80 known moons
+    • Saturn's rings are made of ice and rock particles
+    • Venus rotates backwards compared to most planets
+    • Mars has seasons like Earth due to its axial tilt
+
+    This simulator shows the relative positions and movements of planets, though distances and sizes are scaled for visibility.
+        """
+
+
+def fast_sincos(angles):
+    """Approximate (sin, cos) of an angle array for cosmetic drawing only
+
+    Each angle is reduced to [-pi/4, pi/4] around the nearest quadrant, where short
+    Taylor polynomials are accurate to about 4e-5, then reflected back by quadrant.
+    """
+    angles = np.asarray(angles, dtype=np.float64)
+    quadrant = np.rint(angles / HALF_PI)
+    r = angles - quadrant * HALF_PI
+    r2 = r * r
+    s = r * (1 - r2 * (1 / 6 - r2 / 120))
+    c = 1 - r2 * (1 / 2 - r2 * (1 / 24 - r2 / 720))
+
+    quadrant = quadrant.astype(np.int64) & 3
+    return np.choose(quadrant, (s, c, -s, -c)), np.choose(quadrant, (c, -s, -c, s))
+
+
+@lru_cache(maxsize=256)
+def hex_to_rgb(color):
+    """Convert a '#RRGGBB' color to an (r, g, b) tuple, parsing each color only once"""
+    return int(color[1:3], 16), int(color[3:5], 16), int(color[5:7], 16)
+
+
+@lru_cache(maxsize=256)
+def mix_hex_colors(color1, color2, ratio):
+    """Mix two '#RRGGBB' colors with a given ratio (0-1), remembering recent results"""
+    r1, g1, b1 = hex_to_rgb(color1)
+    r2, g2, b2 = hex_to_rgb(color2)
+
+    # Mix colors
+    inverse = 1 - ratio
+    r = int(r1 * ratio + r2 * inverse)
+    g = int(g1 * ratio + g2 * inverse)
+    b = int(b1 * ratio + b2 * inverse)
+    return f'#{r:02x}{g:02x}{b:02x}'
+
+
+class OrbitalBody:
+    """Base class for bodies whose orbital state lives in shared NumPy arrays"""
+
+    __slots__ = ('_orbit_state', '_index')
+
+    def bind_orbit_state(self, state, index):
+        """Attach this body to a slot in the explorer's orbit state arrays"""
+        self._orbit_state = state
+        self._index = index
+
+    @property
+    def angle(self):
+        return self._orbit_state['angles'][self._index]
+
+    @angle.setter
+    def angle(self, value):
+        self._orbit_state['angles'][self._index] = value
+
+    @property
+    def x(self):
+        return self._orbit_state['xs'][self._index]
+
+    @property
+    def y(self):
+        return self._orbit_state['ys'][self._index]
+
+    @property
+    def z(self):
+        return self._orbit_state['zs'][self._index]
+
+
+class Planet(OrbitalBody):
     """Class to represent a planet with its properties and orbital data"""
 
+    __slots__ = (
+        'name', 'radius', 'distance_from_sun', 'orbital_speed', 'color', 'moons', 'facts',
+        'axial_tilt', 'orbital_inclination', 'incl_cos', 'incl_sin', 'has_rings', 'initial_angle',
+        'image_path', 'image', 'photo_image', 'texture_image',
+        'mass', 'diameter', 'density', 'gravity', 'escape_velocity', 'rotation_period',
+        'length_of_day', 'perihelion', 'aphelion', 'orbital_period', 'orbital_velocity',
+        'orbital_eccentricity', 'obliquity_to_orbit', 'mean_temperature', 'surface_pressure',
+        'has_ring_system', 'has_global_magnetic_field', 'moon_objects',
+        '_shadow_id', '_canvas_id', '_ring_id', '_label_id',
+    )
+
     def __init__(self, name, radius, distance_from_sun, orbital_speed, color,
                  moons, facts, axial_tilt, orbital_inclination, has_rings=False,
                  image_path=None, mass=None, diameter=None, density=None,
@@ -26,7 +174,7 @@ class Planet:
                  orbital_period=None, orbital_velocity=None,
                  orbital_eccentricity=None, obliquity_to_orbit=None,
                  mean_temperature=None, surface_pressure=None,
-                 has_ring_system=None, has_global_magnetic_field=None):
+                 has_ring_system=None, has_global_magnetic_field=None, init_angle=None):
         self.name = name
         self.radius = radius  # Scaled radius for visualization
         self.distance_from_sun = distance_from_sun  # Scaled distance
@@ -38,13 +186,8 @@ class Planet:
         self.orbital_inclination = orbital_inclination  # Orbital inclination in degrees
         self.has_rings = has_rings  # Whether the planet has rings
 
-        # Position and orientation
-        self.angle = random.uniform(0, 2 * math.pi)  # Random starting position
-        self.initial_angle = self.angle  # Store initial angle for reset
-        self.x = 0
-        self.y = 0
-        self.z = 0  # For 3D depth
-        self.rotation_angle = 0  # For planet rotation
+        # Starting position; the live angle and x/y/z are held in the explorer's orbit arrays
+        self.initial_angle = random.uniform(0, 2 * math.pi) if init_angle is None else init_angle
 
         # Image handling
         self.image_path = image_path
@@ -74,19 +217,13 @@ class Planet:
         # Moons
         self.moon_objects = []
 
-    def update_position(self, time_scale=1.0):
-        """Update planet position based on orbital motion"""
-        self.angle += self.orbital_speed * time_scale
-        self.rotation_angle += 0.02 * time_scale  # Planet rotation
+    @property
+    def rotation_angle(self):
+        return self._orbit_state['rotations'][self._index]
 
-        # Calculate position in 3D space with inclination
-        self.x = self.distance_from_sun * math.cos(self.angle)
-        self.y = self.distance_from_sun * math.sin(self.angle) * math.cos(math.radians(self.orbital_inclination))
-        self.z = self.distance_from_sun * math.sin(self.angle) * math.sin(math.radians(self.orbital_inclination))
-
-        # Update moon positions
-        for moon in self.moon_objects:
-            moon.update_position(time_scale)
+    @rotation_angle.setter
+    def rotation_angle(self, value):
+        self._orbit_state['rotations'][self._index] = value
 
     def reset_position(self):
         """Reset planet to initial position"""
@@ -97,10 +234,15 @@ class Planet:
             moon.reset_position()
 
 
-class Moon:
+class Moon(OrbitalBody):
     """Class to represent a moon orbiting a planet"""
 
-    def __init__(self, name, planet, radius, distance, orbital_speed, color, facts=None):
+    __slots__ = (
+        'name', 'planet', 'radius', 'distance', 'orbital_speed', 'color', 'facts', 'initial_angle',
+        '_canvas_id', '_label_id',
+    )
+
+    def __init__(self, name, planet, radius, distance, orbital_speed, color, facts=None, init_angle=None):
         self.name = name
         self.planet = planet
         self.radius = radius
@@ -108,16 +250,7 @@ class Moon:
         self.orbital_speed = orbital_speed
         self.color = color
         self.facts = facts or f"Natural satellite of {planet.name}"
-        self.angle = random.uniform(0, 2 * math.pi)
-        self.initial_angle = self.angle  # Store initial angle for reset
-        self.x = 0
-        self.y = 0
-
-    def update_position(self, time_scale=1.0):
-        """Update moon position relative to its planet"""
-        self.angle += self.orbital_speed * time_scale
-        self.x = self.planet.x + self.distance * math.cos(self.angle)
-        self.y = self.planet.y + self.distance * math.sin(self.angle)
+        self.initial_angle = random.uniform(0, 2 * math.pi) if init_angle is None else init_angle
 
     def reset_position(self):
         """Reset moon to initial position"""
@@ -125,24 +258,30 @@ class Moon:
 
 
 class SolarSystemExplorer:
+    # CSV columns converted to float once at load time
+    _NUMERIC_COLS = {
+        # planets.csv
+        'mass', 'diameter', 'density', 'gravity', 'escape_velocity', 'rotation_period',
+        'length_of_day', 'distance_from_sun', 'perihelion', 'aphelion', 'orbital_period',
+        'orbital_velocity', 'orbital_inclination', 'orbital_eccentricity', 'obliquity_to_orbit',
+        'mean_temperature', 'surface_pressure', 'number_of_moons',
+        # satellites.csv
+        'gm', 'radius', 'magnitude', 'albedo',
+    }
+
+    # Resolution of the radial gradient images that shaded circles are scaled down from
+    _GRADIENT_SIZE = 256
+
+    # How far the 3D drop shadow sits below and to the right of its planet
+    _SHADOW_OFFSET = 3
+
+    # Scaled sprites kept around for reuse. Evicting one only drops the cache's reference:
+    # images still shown on the canvas stay alive through _item_sprites
+    _SPRITE_CACHE_LIMIT = 64
+
     def mix_colors(self, color1, color2, ratio):
         """Mix two colors with a given ratio (0-1)"""
-
-        # Convert hex to RGB
-        def hex_to_rgb(hex_color):
-            hex_color = hex_color.lstrip('#')
-            return tuple(int(hex_color[i:i + 2], 16) for i in (0, 2, 4))
-
-        # Convert RGB to hex
-        def rgb_to_hex(rgb):
-            return '#%02x%02x%02x' % rgb
-
-        rgb1 = hex_to_rgb(color1)
-        rgb2 = hex_to_rgb(color2)
-
-        # Mix colors
-        mixed = tuple(int(rgb1[i] * ratio + rgb2[i] * (1 - ratio)) for i in range(3))
-        return rgb_to_hex(mixed)
+        return mix_hex_colors(color1, color2, ratio)
 
     def __init__(self, root):
         self.root = root
@@ -194,6 +333,26 @@ class SolarSystemExplorer:
         self.planet_images = {}
         self.sun_image = None
         self.ring_images = {}
+        self._starfield_photo = None  # Offscreen-rendered starfield shown as one canvas item
+        # PIL source of every canvas PhotoImage by Tk image name, so screenshots can repaint them
+        self._photo_sources = {}
+
+        # Star (x, y, size, color) lists keyed by canvas size, so resizing back skips the RNG
+        self._star_cache = {}
+
+        # Sphere-shading masks keyed by texture size, shared by all planets
+        self._shade_cache = {}
+
+        # LRU of scaled PhotoImages keyed by (name, size bucket, resample); also keeps Tk from collecting them
+        self._sprite_cache = OrderedDict()
+        # Full-resolution radial gradient images keyed by their colors and ratios
+        self._shaded_sprites = {}
+        # Planets currently showing a quick BILINEAR sprite, upgraded once zooming settles
+        self._coarse_sprites = {}
+        self._refine_after = None
+
+        # Seeded so starting positions are the same on every run
+        self._rng = np.random.default_rng(42)
 
         # Load data
         self.planet_data = self.load_planet_data("planets.csv")
@@ -203,6 +362,10 @@ class SolarSystemExplorer:
         self.planets = self.initialize_planets()
         self.initialize_moons()
 
+        # Pack orbital state into arrays so each frame is a handful of vectorized ops
+        self.initialize_orbit_state()
+        self.initialize_orbit_paths()
+
         # Load images
         self.load_images()
 
@@ -211,8 +374,24 @@ class SolarSystemExplorer:
 
         self.create_menu_bar()
 
-        # Start animation thread
-        self.animation_thread = None
+        # Help windows by title, hidden rather than destroyed when closed
+        self._text_windows = {}
+
+        # Pending root.after id of the next animation frame, None when no frame is scheduled
+        self._tick_id = None
+
+        # Set by input handlers; the next frame (or an idle callback when paused) redraws once
+        self._dirty = False
+
+        self._last_date = None  # Day the date label currently shows
+
+        # Retained canvas items: layer tag -> (shape key, position), updated in place each frame
+        self._canvas_ids = {}
+        self._shown = {}  # Last applied visibility of the orbit/moon layers
+        self._stack_order = None  # Planet order the layers were last stacked in
+        self._culled = set()  # Layers left off-screen and skipped until they come back into view
+        # Sprite each image item shows, so LRU eviction never frees an image still on the canvas
+        self._item_sprites = {}
 
         # Initial draw
         self.draw_solar_system()
@@ -220,8 +399,7 @@ class SolarSystemExplorer:
     def load_planet_data(self, filename):
         """Load planet data from CSV file"""
         try:
-            with open(filename, newline='') as csvfile:
-                return {row['planet']: row for row in csv.DictReader(csvfile)}
+            return {row['planet']: row for row in self.read_typed_csv(filename)}
         except Exception as e:
             print(f"Error loading planet data: {e}")
             return {}
@@ -229,12 +407,39 @@ class SolarSystemExplorer:
     def load_satellite_data(self, filename):
         """Load satellite data from CSV file"""
         try:
-            with open(filename, newline='') as csvfile:
-                return list(csv.DictReader(csvfile))
+            return self.read_typed_csv(filename)
         except Exception as e:
             print(f"Error loading satellite data: {e}")
             return []
 
+    def read_typed_csv(self, filename):
+        """Read a CSV file into row dicts, converting numeric columns to float once"""
+        with open(filename, newline='') as csvfile:
+            reader = csv.reader(csvfile)
+            header = next(reader)
+            numeric = [column in self._NUMERIC_COLS for column in header]
+            return [
+                {column: self.parse_number(value) if is_numeric else value
+                 for column, value, is_numeric in zip(header, values, numeric)}
+                for values in reader
+            ]
+
+    def parse_number(self, value):
+        """Convert a CSV field to float; empty fields become None and annotated
+        values such as 'Unknown*' or '4902.801±0.001' are kept as text"""
+        if not value:
+            return None
+        try:
+            return float(value)
+        except ValueError:
+            return value
+
+    def format_value(self, value):
+        """Format a data value for display without float noise (1898.0 -> 1898)"""
+        if isinstance(value, float):
+            return f'{value:f}'.rstrip('0').rstrip('.')
+        return value
+
     def initialize_planets(self):
         """Initialize all planets with their properties"""
         planets_data = {
@@ -313,8 +518,16 @@ class SolarSystemExplorer:
             }
         }
 
+        # Count catalogued moons per planet in a single pass over the satellite data
+        moon_counts = defaultdict(int)
+        for satellite in self.satellite_data:
+            moon_counts[satellite['planet']] += 1
+
+        # Draw every starting angle in one call
+        init_angles = self._rng.uniform(0, 2 * np.pi, size=len(planets_data)).tolist()
+
         planets = []
-        for name, data in planets_data.items():
+        for (name, data), init_angle in zip(planets_data.items(), init_angles):
             csv_data = self.planet_data.get(name, {})
             planet = Planet(
                 name=name,
@@ -322,7 +535,7 @@ class SolarSystemExplorer:
                 distance_from_sun=data['distance'],
                 orbital_speed=data['speed'],
                 color=data['color'],
-                moons=self.count_moons(name),
+                moons=moon_counts[name],
                 facts=data['facts'],
                 axial_tilt=data['axial_tilt'],
                 orbital_inclination=data['inclination'],
@@ -344,16 +557,17 @@ class SolarSystemExplorer:
                 mean_temperature=csv_data.get('mean_temperature'),
                 surface_pressure=csv_data.get('surface_pressure'),
                 has_ring_system=csv_data.get('has_ring_system'),
-                has_global_magnetic_field=csv_data.get('has_global_magnetic_field')
+                has_global_magnetic_field=csv_data.get('has_global_magnetic_field'),
+                init_angle=init_angle
             )
+            # Inclination never changes; both the vectorized orbit update and the orbit
+            # paths read these instead of converting degrees every frame
+            planet.incl_cos = math.cos(math.radians(planet.orbital_inclination))
+            planet.incl_sin = math.sin(math.radians(planet.orbital_inclination))
             planets.append(planet)
 
         return planets
 
-    def count_moons(self, planet_name):
-        """Count moons for a specific planet"""
-        return sum(1 for moon in self.satellite_data if moon['planet'] == planet_name)
-
     def initialize_moons(self):
         """Initialize moon objects for each planet"""
         moon_data = {
@@ -368,13 +582,149 @@ class SolarSystemExplorer:
             'Pluto': [('Charon', 1, 15, 0.03, '#D3D3D3')]
         }
 
+        moon_count = sum(len(moon_data.get(planet.name, ())) for planet in self.planets)
+        init_angles = iter(self._rng.uniform(0, 2 * np.pi, size=moon_count).tolist())
+
         for planet in self.planets:
             if planet.name in moon_data:
                 for moon_info in moon_data[planet.name]:
                     name, radius, distance, speed, color = moon_info
-                    moon = Moon(name, planet, radius, distance, speed, color)
+                    moon = Moon(name, planet, radius, distance, speed, color, init_angle=next(init_angles))
                     planet.moon_objects.append(moon)
 
+    def initialize_orbit_state(self):
+        """Build the structure-of-arrays orbit state (planets first, then moons grouped by parent)"""
+        bodies = list(self.planets)
+        distances = [planet.distance_from_sun for planet in self.planets]
+        incl_cos = [planet.incl_cos for planet in self.planets]
+        incl_sin = [planet.incl_sin for planet in self.planets]
+        parents = []
+        for index, planet in enumerate(self.planets):
+            for moon in planet.moon_objects:
+                bodies.append(moon)
+                distances.append(moon.distance)
+                incl_cos.append(1.0)  # Moons orbit flat around their planet
+                incl_sin.append(0.0)
+                parents.append(index)
+
+        count = len(bodies)
+        state = {
+            'angles': np.array([body.initial_angle for body in bodies], dtype=np.float64),
+            'speeds': np.array([body.orbital_speed for body in bodies], dtype=np.float64),
+            'distances': np.array(distances, dtype=np.float64),
+            'incl_cos': np.array(incl_cos, dtype=np.float64),
+            'incl_sin': np.array(incl_sin, dtype=np.float64),
+            'rotations': np.zeros(len(self.planets)),
+            'cos_a': np.zeros(count),
+            'sin_a': np.zeros(count),
+            'xs': np.zeros(count),
+            'ys': np.zeros(count),
+            'zs': np.zeros(count),
+        }
+        self._planet_count = len(self.planets)
+        self._planet_radii = np.array([planet.radius for planet in self.planets], dtype=np.float64)
+        self._moon_parents = np.array(parents, dtype=np.intp)
+
+        for index, body in enumerate(bodies):
+            body.bind_orbit_state(state, index)
+
+        # Per-step rotation (cos, sin) of speeds * dt, rebuilt only when dt changes
+        self._step_dt = None
+        self._step_cos = None
+        self._step_sin = None
+        self._steps_since_renormalize = 0
+
+        self._orbit_state = state
+        self._bind_projection()
+        self._sync_orbit_trig()
+        self._update_positions()
+
+    def initialize_orbit_paths(self, segments=64):
+        """Precompute every orbit as a closed polyline in world coordinates, for both 2D and 3D views"""
+        theta = np.linspace(0, 2 * math.pi, segments + 1)
+        sin_t, cos_t = fast_sincos(theta)  # Sub-pixel error at any zoom the app allows
+
+        self._orbit_paths = {}
+        for show_3d in (False, True):
+            paths = []
+            for planet in self.planets:
+                # Use the same projection the planets are drawn with so orbits pass through them
+                y_scale = planet.incl_cos
+                if show_3d:
+                    y_scale += planet.incl_sin * self.depth_factor
+                path = np.empty((segments + 1, 2))
+                path[:, 0] = planet.distance_from_sun * cos_t
+                path[:, 1] = planet.distance_from_sun * y_scale * sin_t
+                path[-1] = path[0]  # Exactly closed, so Tk smooths it as a loop
+                paths.append(path)
+            self._orbit_paths[show_3d] = paths
+
+    def _sync_orbit_trig(self):
+        """Recompute the cached (cos, sin) of every orbital angle, e.g. after a reset"""
+        state = self._orbit_state
+        np.cos(state['angles'], out=state['cos_a'])
+        np.sin(state['angles'], out=state['sin_a'])
+        self._steps_since_renormalize = 0
+
+    def _advance(self, dt):
+        """Advance every planet and moon by one animation step"""
+        state = self._orbit_state
+        if dt != self._step_dt:
+            step = state['speeds'] * dt
+            self._step_dt = dt
+            self._step_cos = np.cos(step)
+            self._step_sin = np.sin(step)
+
+        state['angles'] += state['speeds'] * dt
+        state['rotations'] += 0.02 * dt  # Planet rotation
+
+        # Rotate (cos, sin) by the step angle via angle addition instead of calling trig
+        cos_a, sin_a = state['cos_a'], state['sin_a']
+        next_cos = cos_a * self._step_cos - sin_a * self._step_sin
+        sin_a *= self._step_cos
+        sin_a += cos_a * self._step_sin
+        cos_a[:] = next_cos
+
+        # Periodically pull (cos, sin) back onto the unit circle to stop rounding drift
+        self._steps_since_renormalize += 1
+        if self._steps_since_renormalize >= 10000:
+            norm = 1.5 - 0.5 * (cos_a * cos_a + sin_a * sin_a)
+            cos_a *= norm
+            sin_a *= norm
+            self._steps_since_renormalize = 0
+
+        self._update_positions()
+
+    def _bind_projection(self):
+        """Pick the position update for the current view once, instead of branching every frame"""
+        self._update_positions = self._update_positions_3d if self.show_3d else self._update_positions_2d
+
+    def _update_positions_2d(self):
+        """Recompute x/y for all bodies from their cached orbital (cos, sin); z is unused in 2D"""
+        state = self._orbit_state
+        np.multiply(state['distances'], state['cos_a'], out=state['xs'])
+        np.multiply(state['distances'] * state['sin_a'], state['incl_cos'], out=state['ys'])
+        self._offset_moons()
+
+    def _update_positions_3d(self):
+        """Recompute x/y/z for all bodies from their cached orbital (cos, sin)"""
+        state = self._orbit_state
+        sin_a = state['sin_a']
+        np.multiply(state['distances'], state['cos_a'], out=state['xs'])
+        np.multiply(state['distances'] * sin_a, state['incl_cos'], out=state['ys'])
+        np.multiply(state['distances'] * sin_a, state['incl_sin'], out=state['zs'])
+        self._offset_moons()
+
+        # Back-to-front planet order for drawing; stable, so ties keep list order
+        self._zorder = np.argsort(state['zs'][:self._planet_count], kind='stable').tolist()
+
+    def _offset_moons(self):
+        """Moons are positioned relative to their parent planet"""
+        state = self._orbit_state
+        moons = slice(self._planet_count, None)
+        state['xs'][moons] += state['xs'][self._moon_parents]
+        state['ys'][moons] += state['ys'][self._moon_parents]
+
     def load_images(self):
         """Load planet and ring images"""
         # Load Sun image
@@ -383,8 +733,10 @@ class SolarSystemExplorer:
             if os.path.exists(path):
                 try:
                     img = Image.open(path)
+                    # Let libjpeg decode at reduced scale; no-op for other formats
+                    img.draft('RGB', (200, 200))
                     img = img.resize((100, 100), Image.Resampling.LANCZOS)
-                    self.sun_image = ImageTk.PhotoImage(img)
+                    self.sun_image = self.make_photo(img)
                     break
                 except Exception as e:
                     print(f"Error loading sun image: {e}")
@@ -399,15 +751,20 @@ class SolarSystemExplorer:
                 path = base_path + ext
                 if os.path.exists(path):
                     try:
+                        size = planet.radius * 2
                         img = Image.open(path)
+                        # Decode JPEGs at reduced scale instead of full resolution
+                        img.draft('RGB', (size * 2, size * 2))
+                        # Normalize once so everything downstream sees the same channel layout
+                        img = img.convert('RGBA')
                         # Create texture map for 3D effect
                         texture = self.create_texture_map(img, planet.color)
                         planet.texture_image = texture
-                        # Resize for 2D view
-                        size = planet.radius * 2
-                        img = img.resize((size, size), Image.Resampling.LANCZOS)
+                        # Resize for 2D view; small sprites look the same with a cheaper filter
+                        resample = Image.Resampling.BILINEAR if size < 64 else Image.Resampling.LANCZOS
+                        img = img.resize((size, size), resample)
                         planet.image = img
-                        planet.photo_image = ImageTk.PhotoImage(img)
+                        planet.photo_image = self.make_photo(img)
                         self.planet_images[planet.name] = planet.photo_image
                         break
                     except Exception as e:
@@ -419,50 +776,48 @@ class SolarSystemExplorer:
             if os.path.exists(path):
                 try:
                     img = Image.open(path)
-                    img = img.resize((100, 20), Image.Resampling.LANCZOS)
+                    img = img.resize((100, 20), Image.Resampling.NEAREST)
                     self.ring_images['default'] = ImageTk.PhotoImage(img)
                     break
                 except Exception as e:
                     print(f"Error loading ring image: {e}")
 
     def create_texture_map(self, img, base_color):
-        """Create a texture map for 3D effect with lighting"""
+        """Create a texture map for 3D effect with lighting from an RGBA image"""
         try:
-            # Convert to RGBA if not already
-            if img.mode != 'RGBA':
-                img = img.convert('RGBA')
-
-            # Create a lighting effect
-            width, height = img.size
-            pixels = img.load()
-
-            for y in range(height):
-                for x in range(width):
-                    r, g, b, a = pixels[x, y]
-                    # Apply lighting based on position (simulate sphere)
-                    dx = (x - width / 2) / (width / 2)
-                    dy = (y - height / 2) / (height / 2)
-                    distance = math.sqrt(dx * dx + dy * dy)
-
-                    if distance <= 1.0:  # Inside circle
-                        # Lighting intensity (simulate 3D sphere)
-                        intensity = 1.0 - distance * 0.7
-                        intensity = max(0.3, min(1.0, intensity))
-                        # Adjust color
-                        r = int(r * intensity)
-                        g = int(g * intensity)
-                        b = int(b * intensity)
-                        # Keep original alpha
-                        pixels[x, y] = (r, g, b, a)
-                    else:
-                        # Transparent outside
-                        pixels[x, y] = (0, 0, 0, 0)
-
-            return img
+            # Create a lighting effect over the whole image at once
+            intensity, outside = self.get_sphere_shading(img.size)
+            pixels = np.asarray(img, dtype=np.float32)  # height x width x RGBA
+
+            # Shade the color channels, keeping the original alpha
+            pixels[..., :3] *= intensity
+
+            # Transparent outside
+            pixels[outside] = 0
+
+            return Image.fromarray(pixels.astype(np.uint8), 'RGBA')
         except Exception as e:
             print(f"Error creating texture map: {e}")
             return None
 
+    def get_sphere_shading(self, size):
+        """Get the (intensity, outside mask) arrays that light a texture of the given size as a sphere"""
+        shading = self._shade_cache.get(size)
+        if shading is None:
+            width, height = size
+
+            # Position of each pixel relative to the image center (simulate sphere)
+            yy, xx = np.mgrid[0:height, 0:width].astype(np.float32)
+            dx = (xx - width / 2) / (width / 2)
+            dy = (yy - height / 2) / (height / 2)
+            dist2 = dx * dx + dy * dy
+
+            # Lighting intensity (simulate 3D sphere), shaped to broadcast over RGB
+            intensity = np.clip(1.0 - np.sqrt(dist2) * 0.7, 0.3, 1.0)[..., None]
+            shading = (intensity, dist2 > 1.0)
+            self._shade_cache[size] = shading
+        return shading
+
     def setup_gui(self):
         """Setup the graphical user interface"""
         # Main frame
@@ -478,6 +833,9 @@ class SolarSystemExplorer:
             highlightthickness=0
         )
         self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 10))
+        # Canvas size as last reported by <Configure>, so drawing never asks Tk for it
+        self._canvas_w = int(self.canvas['width'])
+        self._canvas_h = int(self.canvas['height'])
 
         # Control panel
         control_frame = tk.Frame(main_frame, bg='#252525', width=250)
@@ -689,7 +1047,6 @@ class SolarSystemExplorer:
             options_frame,
             text="Show Orbits",
             variable=self.orbit_var,
-            command=self.toggle_orbits,
             fg='white',
             bg='#252525',
             selectcolor='black',
@@ -703,7 +1060,6 @@ class SolarSystemExplorer:
             options_frame,
             text="Show Names",
             variable=self.name_var,
-            command=self.toggle_names,
             fg='white',
             bg='#252525',
             selectcolor='black',
@@ -717,7 +1073,6 @@ class SolarSystemExplorer:
             options_frame,
             text="Show Moons",
             variable=self.moon_var,
-            command=self.toggle_moons,
             fg='white',
             bg='#252525',
             selectcolor='black',
@@ -731,7 +1086,6 @@ class SolarSystemExplorer:
             options_frame,
             text="3D View",
             variable=self.d3_var,
-            command=self.toggle_3d,
             fg='white',
             bg='#252525',
             selectcolor='black',
@@ -740,6 +1094,12 @@ class SolarSystemExplorer:
         )
         d3_cb.pack(anchor='w')
 
+        # The checkbuttons and the View menu share these variables, so one trace covers both
+        self.observe_option(self.orbit_var, 'show_orbits')
+        self.observe_option(self.name_var, 'show_names')
+        self.observe_option(self.moon_var, 'show_moons')
+        self.observe_option(self.d3_var, 'show_3d', self._reproject)
+
         # Planet selection
         planet_frame = tk.LabelFrame(
             control_frame,
@@ -776,12 +1136,16 @@ class SolarSystemExplorer:
         self.canvas.bind("<B1-Motion>", self.on_canvas_drag)
         self.canvas.bind("<MouseWheel>", self.on_mouse_wheel)
         self.canvas.bind("<Motion>", self.on_mouse_move)
+        self.canvas.bind("<Configure>", self.on_canvas_configure)
 
         # Variables for dragging
         self.last_x = 0
         self.last_y = 0
         self.dragging = False
 
+        # Bursts of hover events are hit-tested at most once per 16 ms
+        self._hover_after = None
+
     def change_theme(self, theme_name):
         """Change the color theme"""
         self.theme = theme_name
@@ -793,7 +1157,7 @@ class SolarSystemExplorer:
 
         if theme_name in themes:
             self.canvas.configure(bg=themes[theme_name]['bg'])
-            self.draw_solar_system()
+            self._schedule_redraw()
 
     def create_menu_bar(self):
         """Create menu bar with File, View, and Help menus"""
@@ -813,10 +1177,10 @@ class SolarSystemExplorer:
         # View Menu
         view_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label="View", menu=view_menu)
-        view_menu.add_checkbutton(label="Show Orbits", variable=self.orbit_var, command=self.toggle_orbits)
-        view_menu.add_checkbutton(label="Show Names", variable=self.name_var, command=self.toggle_names)
-        view_menu.add_checkbutton(label="Show Moons", variable=self.moon_var, command=self.toggle_moons)
-        view_menu.add_checkbutton(label="3D View", variable=self.d3_var, command=self.toggle_3d)
+        view_menu.add_checkbutton(label="Show Orbits", variable=self.orbit_var)
+        view_menu.add_checkbutton(label="Show Names", variable=self.name_var)
+        view_menu.add_checkbutton(label="Show Moons", variable=self.moon_var)
+        view_menu.add_checkbutton(label="3D View", variable=self.d3_var)
         view_menu.add_separator()
         view_menu.add_command(label="Reset View", command=self.reset_view)
         view_menu.add_command(label="Zoom In", command=self.zoom_in)
@@ -841,20 +1205,54 @@ class SolarSystemExplorer:
                 filetypes=[("PNG files", "*.png"), ("JPEG files", "*.jpg"), ("All files", "*.*")]
             )
             if filename:
-                # Get canvas dimensions
-                x = self.canvas.winfo_rootx()
-                y = self.canvas.winfo_rooty()
-                x1 = x + self.canvas.winfo_width()
-                y1 = y + self.canvas.winfo_height()
-
-                # Take screenshot using PIL
-                from PIL import ImageGrab
-                screenshot = ImageGrab.grab(bbox=(x, y, x1, y1))
+                # Paint the canvas offscreen rather than grabbing it from the screen
+                screenshot = self.render_canvas_image()
                 screenshot.save(filename)
                 messagebox.showinfo("Screenshot Saved", f"Screenshot saved as {os.path.basename(filename)}")
         except Exception as e:
             messagebox.showerror("Error", f"Could not save screenshot: {e}")
 
+    def render_canvas_image(self):
+        """Paint the visible canvas items, bottom to top, into a PIL image of the canvas size"""
+        canvas = self.canvas
+        image = Image.new('RGB', (self._canvas_w, self._canvas_h), canvas.cget('bg'))
+        draw = ImageDraw.Draw(image)
+        font = ImageFont.load_default()
+
+        for item in canvas.find_all():
+            if canvas.itemcget(item, 'state') == tk.HIDDEN:
+                continue
+            kind = canvas.type(item)
+            coords = canvas.coords(item)
+            if kind == 'image':
+                source = self._photo_sources.get(str(canvas.itemcget(item, 'image')))
+                if source is None:
+                    continue
+                x, y = coords
+                if canvas.itemcget(item, 'anchor') != 'nw':
+                    x -= source.width / 2
+                    y -= source.height / 2
+                source = source.convert('RGBA')
+                image.paste(source, (round(x), round(y)), source)
+            elif kind == 'oval':
+                draw.ellipse(
+                    coords,
+                    fill=canvas.itemcget(item, 'fill') or None,
+                    outline=canvas.itemcget(item, 'outline') or None,
+                    width=round(float(canvas.itemcget(item, 'width')))
+                )
+            elif kind == 'line':
+                draw.line(coords, fill=canvas.itemcget(item, 'fill'),
+                          width=round(float(canvas.itemcget(item, 'width'))))
+            elif kind == 'text':
+                # Tk centers text on its position by default
+                text = canvas.itemcget(item, 'text')
+                left, top, right, bottom = draw.textbbox((0, 0), text, font=font)
+                x = coords[0] - (left + right) / 2
+                y = coords[1] - (top + bottom) / 2
+                draw.text((x, y), text, fill=canvas.itemcget(item, 'fill'), font=font)
+        return image
+
     def export_data(self):
         """Export planet data to CSV"""
         try:
@@ -864,24 +1262,16 @@ class SolarSystemExplorer:
                 filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
             )
             if filename:
-                with open(filename, 'w', newline='') as csvfile:
-                    fieldnames = ['Name', 'Distance_from_Sun', 'Radius', 'Orbital_Speed',
-                                  'Color', 'Moons', 'Axial_Tilt', 'Orbital_Inclination', 'Has_Rings']
-                    writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                    writer.writeheader()
-
-                    for planet in self.planets:
-                        writer.writerow({
-                            'Name': planet.name,
-                            'Distance_from_Sun': planet.distance_from_sun,
-                            'Radius': planet.radius,
-                            'Orbital_Speed': planet.orbital_speed,
-                            'Color': planet.color,
-                            'Moons': planet.moons,
-                            'Axial_Tilt': planet.axial_tilt,
-                            'Orbital_Inclination': planet.orbital_inclination,
-                            'Has_Rings': planet.has_rings
-                        })
+                with open(filename, 'w', newline='', buffering=1 << 20) as csvfile:
+                    writer = csv.writer(csvfile)
+                    writer.writerow(['Name', 'Distance_from_Sun', 'Radius', 'Orbital_Speed',
+                                     'Color', 'Moons', 'Axial_Tilt', 'Orbital_Inclination', 'Has_Rings'])
+                    writer.writerows([
+                        (planet.name, planet.distance_from_sun, planet.radius, planet.orbital_speed,
+                         planet.color, planet.moons, planet.axial_tilt, planet.orbital_inclination,
+                         planet.has_rings)
+                        for planet in self.planets
+                    ])
                 messagebox.showinfo("Data Exported", f"Planet data exported to {os.path.basename(filename)}")
         except Exception as e:
             messagebox.showerror("Error", f"Could not export data: {e}")
@@ -901,109 +1291,40 @@ class SolarSystemExplorer:
 
     def show_controls(self):
         """Show controls help dialog"""
-        controls_text = """
-    SOLAR SYSTEM EXPLORER - CONTROLS
-
-    🖱️ MOUSE CONTROLS:
-    • Left Click + Drag: Pan the view
-    • Mouse Wheel: Zoom in/out
-    • Click on Planet: Select and show info
-
-    ⌨️ KEYBOARD SHORTCUTS:
-    • Escape: Exit fullscreen mode
-
-    🎮 INTERFACE CONTROLS:
-    • Start/Pause: Control animation
-    • Reset: Reset view and positions
-    • Time Speed: Control animation speed
-    • Zoom In/Out: Adjust view scale
-
-    🔧 VIEW OPTIONS:
-    • Show Orbits: Toggle orbital paths
-    • Show Names: Toggle planet labels
-    • Show Moons: Toggle moon visibility
-    • 3D View: Enable 3D perspective
-
-    🎵 MUSIC CONTROLS:
-    • Load Music: Add background music
-    • Volume: Adjust music volume
-    • Music ON/OFF: Toggle playback
-
-    📊 PLANET INFO:
-    • Select planet from dropdown
-    • Click "Detailed Info" for full data
-    • Click directly on planets for quick info
-        """
-
-        info_window = tk.Toplevel(self.root)
-        info_window.title("Controls Help")
-        info_window.geometry("500x600")
-        info_window.configure(bg='#252525')
-
-        text_widget = tk.Text(
-            info_window,
-            wrap=tk.WORD,
-            bg='#121212',
-            fg='white',
-            font=("Arial", 10),
-            padx=15,
-            pady=15
-        )
-        text_widget.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        text_widget.insert(tk.END, controls_text)
-        text_widget.config(state=tk.DISABLED)
+        self.show_text_window("Controls Help", "500x600", 10, CONTROLS_TEXT)
 
     def show_about_planets(self):
         """Show information about the solar system"""
-        about_text = """
-    🌌 ABOUT OUR SOLAR SYSTEM
-
-    Our solar system consists of the Sun and all celestial objects that orbit it, including planets, moons, asteroids, and comets.
-
-    🪐 THE PLANETS:
-
-    INNER PLANETS (Rocky):
-    • Mercury: Closest to Sun, extreme temperatures
-    • Venus: Hottest planet, thick toxic atmosphere
-    • Earth: Our home, the only known planet with life
-    • Mars: The Red Planet, largest volcano in solar system
-
-    OUTER PLANETS (Gas/Ice Giants):
-    • Jupiter: Largest planet, Great Red Spot storm
-    • Saturn: Famous rings, less dense than water
-    • Uranus: Tilted on its side, ice giant
-    • Neptune: Windiest planet, deep blue color
-
-    🌙 MOONS:
-    Our solar system has over 200 known moons, from tiny asteroids to bodies larger than Mercury.
-
-    ⭐ INTERESTING FACTS:
-    • The Sun contains 99.86% of the solar system's mass
-    • Jupiter has more than 80 known moons
-    • Saturn's rings are made of ice and rock particles
-    • Venus rotates backwards compared to most planets
-    • Mars has seasons like Earth due to its axial tilt
-
-    This simulator shows the relative positions and movements of planets, though distances and sizes are scaled for visibility.
-        """
+        self.show_text_window("About Our Solar System", "600x700", 11, ABOUT_PLANETS_TEXT)
+
+    def show_text_window(self, title, geometry, font_size, text):
+        """Show a read-only text window, building it on first use and reusing it afterwards"""
+        info_window = self._text_windows.get(title)
+        if info_window is not None and info_window.winfo_exists():
+            info_window.deiconify()
+            info_window.lift()
+            return
 
         info_window = tk.Toplevel(self.root)
-        info_window.title("About Our Solar System")
-        info_window.geometry("600x700")
+        info_window.title(title)
+        info_window.geometry(geometry)
         info_window.configure(bg='#252525')
+        # Closing only hides the window so the next open is instant
+        info_window.protocol("WM_DELETE_WINDOW", info_window.withdraw)
 
         text_widget = tk.Text(
             info_window,
             wrap=tk.WORD,
             bg='#121212',
             fg='white',
-            font=("Arial", 11),
+            font=("Arial", font_size),
             padx=15,
             pady=15
         )
         text_widget.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        text_widget.insert(tk.END, about_text)
+        text_widget.insert(tk.END, text)
         text_widget.config(state=tk.DISABLED)
+        self._text_windows[title] = info_window
 
     def show_about(self):
         """Show about dialog"""
@@ -1102,14 +1423,18 @@ class SolarSystemExplorer:
         """Start the animation"""
         if not self.is_running:
             self.is_running = True
-            if self.animation_thread is None or not self.animation_thread.is_alive():
-                self.animation_thread = threading.Thread(target=self.animate)
-                self.animation_thread.daemon = True
-                self.animation_thread.start()
+            self._tick_id = self.root.after(50, self._tick)
 
     def pause_animation(self):
         """Pause the animation"""
         self.is_running = False
+        if self._tick_id is not None:
+            # Drop the pending frame so a quick pause/start never runs two loops
+            self.root.after_cancel(self._tick_id)
+            self._tick_id = None
+        if self._dirty:
+            # A change made while running was waiting for the frame just cancelled
+            self.root.after_idle(self._redraw)
 
     def reset_view(self):
         """Reset the view to initial state"""
@@ -1118,43 +1443,39 @@ class SolarSystemExplorer:
         self.center_y = 400
         for planet in self.planets:
             planet.reset_position()
-        self.draw_solar_system()
+        self._sync_orbit_trig()
+        self._update_positions()
+        self._schedule_redraw()
 
     def reset_date(self):
         """Reset date to current date"""
         self.current_date = datetime.now()
         self.initial_date = datetime.now()
-        self.date_label.config(text=self.current_date.strftime("%Y-%m-%d"))
+        self.update_date_label()
 
     def zoom_in(self):
         """Zoom in the view"""
         self.zoom_factor *= 1.2
-        self.draw_solar_system()
+        self._schedule_redraw()
 
     def zoom_out(self):
         """Zoom out the view"""
         self.zoom_factor /= 1.2
-        self.draw_solar_system()
-
-    def toggle_orbits(self):
-        """Toggle orbit visibility"""
-        self.show_orbits = bool(self.orbit_var.get())
-        self.draw_solar_system()
-
-    def toggle_names(self):
-        """Toggle name visibility"""
-        self.show_names = bool(self.name_var.get())
-        self.draw_solar_system()
-
-    def toggle_moons(self):
-        """Toggle moon visibility"""
-        self.show_moons = bool(self.moon_var.get())
-        self.draw_solar_system()
-
-    def toggle_3d(self):
-        """Toggle 3D view"""
-        self.show_3d = bool(self.d3_var.get())
-        self.draw_solar_system()
+        self._schedule_redraw()
+
+    def observe_option(self, var, attr, on_change=None):
+        """Mirror a view option variable into `attr` and redraw whenever it is written"""
+        def on_write(*_):
+            setattr(self, attr, bool(var.get()))
+            if on_change is not None:
+                on_change()
+            self._schedule_redraw()
+        var.trace_add('write', on_write)
+
+    def _reproject(self):
+        """Switch the position update to the current projection"""
+        self._bind_projection()
+        self._update_positions()  # z is stale after running in 2D
 
     def show_planet_info(self, event=None):
         """Show information about selected planet"""
@@ -1209,45 +1530,45 @@ class SolarSystemExplorer:
 
         # Physical properties
         info_text += "🔬 PHYSICAL PROPERTIES:\n"
-        if planet.mass:
-            info_text += f"• Mass: {planet.mass} × 10²⁴ kg\n"
-        if planet.diameter:
-            info_text += f"• Diameter: {planet.diameter} km\n"
-        if planet.density:
-            info_text += f"• Density: {planet.density} kg/m³\n"
-        if planet.gravity:
-            info_text += f"• Surface Gravity: {planet.gravity} m/s²\n"
-        if planet.escape_velocity:
-            info_text += f"• Escape Velocity: {planet.escape_velocity} km/s\n"
+        if planet.mass is not None:
+            info_text += f"• Mass: {self.format_value(planet.mass)} × 10²⁴ kg\n"
+        if planet.diameter is not None:
+            info_text += f"• Diameter: {self.format_value(planet.diameter)} km\n"
+        if planet.density is not None:
+            info_text += f"• Density: {self.format_value(planet.density)} kg/m³\n"
+        if planet.gravity is not None:
+            info_text += f"• Surface Gravity: {self.format_value(planet.gravity)} m/s²\n"
+        if planet.escape_velocity is not None:
+            info_text += f"• Escape Velocity: {self.format_value(planet.escape_velocity)} km/s\n"
 
         # Rotational properties
         info_text += "\n🔄 ROTATION:\n"
-        if planet.rotation_period:
-            info_text += f"• Rotation Period: {planet.rotation_period} hours\n"
-        if planet.length_of_day:
-            info_text += f"• Length of Day: {planet.length_of_day} hours\n"
+        if planet.rotation_period is not None:
+            info_text += f"• Rotation Period: {self.format_value(planet.rotation_period)} hours\n"
+        if planet.length_of_day is not None:
+            info_text += f"• Length of Day: {self.format_value(planet.length_of_day)} hours\n"
         info_text += f"• Axial Tilt: {planet.axial_tilt}°\n"
 
         # Orbital properties
         info_text += "\n🌌 ORBITAL PROPERTIES:\n"
-        if planet.orbital_period:
-            info_text += f"• Orbital Period: {planet.orbital_period} days\n"
-        if planet.orbital_velocity:
-            info_text += f"• Orbital Velocity: {planet.orbital_velocity} km/s\n"
-        if planet.perihelion:
-            info_text += f"• Perihelion: {planet.perihelion} × 10⁶ km\n"
-        if planet.aphelion:
-            info_text += f"• Aphelion: {planet.aphelion} × 10⁶ km\n"
-        if planet.orbital_eccentricity:
-            info_text += f"• Orbital Eccentricity: {planet.orbital_eccentricity}\n"
+        if planet.orbital_period is not None:
+            info_text += f"• Orbital Period: {self.format_value(planet.orbital_period)} days\n"
+        if planet.orbital_velocity is not None:
+            info_text += f"• Orbital Velocity: {self.format_value(planet.orbital_velocity)} km/s\n"
+        if planet.perihelion is not None:
+            info_text += f"• Perihelion: {self.format_value(planet.perihelion)} × 10⁶ km\n"
+        if planet.aphelion is not None:
+            info_text += f"• Aphelion: {self.format_value(planet.aphelion)} × 10⁶ km\n"
+        if planet.orbital_eccentricity is not None:
+            info_text += f"• Orbital Eccentricity: {self.format_value(planet.orbital_eccentricity)}\n"
         info_text += f"• Orbital Inclination: {planet.orbital_inclination}°\n"
 
         # Atmospheric properties
         info_text += "\n🌡️ ATMOSPHERIC CONDITIONS:\n"
-        if planet.mean_temperature:
-            info_text += f"• Mean Temperature: {planet.mean_temperature}°C\n"
-        if planet.surface_pressure:
-            info_text += f"• Surface Pressure: {planet.surface_pressure} bars\n"
+        if planet.mean_temperature is not None:
+            info_text += f"• Mean Temperature: {self.format_value(planet.mean_temperature)}°C\n"
+        if planet.surface_pressure is not None:
+            info_text += f"• Surface Pressure: {self.format_value(planet.surface_pressure)} bars\n"
 
         # Other features
         info_text += "\n✨ SPECIAL FEATURES:\n"
@@ -1286,19 +1607,41 @@ class SolarSystemExplorer:
             self.center_y += dy
             self.last_x = event.x
             self.last_y = event.y
+            self._schedule_redraw()
+
+    def _schedule_redraw(self):
+        """Mark the scene dirty so it is drawn once, however many changes arrive first
+
+        While animating the next frame draws it anyway; when paused an idle
+        callback does.
+        """
+        if not self._dirty:
+            self._dirty = True
+            if not self.is_running:
+                self.root.after_idle(self._redraw)
+
+    def _redraw(self):
+        """Draw the scene if no frame has done so since it was marked dirty"""
+        if self._dirty:
             self.draw_solar_system()
 
     def on_mouse_wheel(self, event):
         """Handle mouse wheel for zooming"""
-        if event.delta > 0:
-            self.zoom_factor *= 1.1
-        else:
-            self.zoom_factor /= 1.1
-        self.draw_solar_system()
+        # Step along a fixed 1.1x ladder so repeated zooms revisit the same cached sprite sizes
+        level = round(math.log(self.zoom_factor, 1.1)) + (1 if event.delta > 0 else -1)
+        self.zoom_factor = 1.1 ** level
+        self._schedule_redraw()
 
     def on_mouse_move(self, event):
-        """Handle mouse movement for hover effects"""
-        planet = self.get_planet_at_position(event.x, event.y)
+        """Handle mouse movement for hover effects, hit-testing only once the pointer pauses for 16 ms"""
+        if self._hover_after is not None:
+            self.root.after_cancel(self._hover_after)
+        self._hover_after = self.root.after(16, self.update_hover, event.x, event.y)
+
+    def update_hover(self, x, y):
+        """Show a hand cursor over planets"""
+        self._hover_after = None
+        planet = self.get_planet_at_position(x, y)
         if planet:
             self.canvas.config(cursor="hand2")
         else:
@@ -1306,101 +1649,218 @@ class SolarSystemExplorer:
 
     def get_planet_at_position(self, x, y):
         """Get planet at given canvas position"""
-        for planet in self.planets:
-            px = self.center_x + planet.x * self.zoom_factor
-            py = self.center_y + planet.y * self.zoom_factor
-            if self.show_3d:
-                py += planet.z * self.depth_factor * self.zoom_factor
-            distance = math.sqrt((x - px) ** 2 + (y - py) ** 2)
-            if distance <= planet.radius * self.zoom_factor:
-                return planet
-        return None
-
-    def animate(self):
-        """Main animation loop"""
-        while self.is_running:
-            # Update planet positions
-            for planet in self.planets:
-                planet.update_position(self.time_scale)
+        screen_x, screen_y = self.project_positions()
+        px = screen_x[:self._planet_count]
+        py = screen_y[:self._planet_count]
+
+        # Compare squared distances; the first planet in list order wins, as before
+        distance2 = (x - px) ** 2 + (y - py) ** 2
+        hits = np.flatnonzero(distance2 <= (self._planet_radii * self.zoom_factor) ** 2)
+        return self.planets[hits[0]] if hits.size else None
+
+    def _tick(self):
+        """Advance one animation frame and schedule the next on Tk's event loop"""
+        # Update planet and moon positions
+        self._advance(self.time_scale)
 
-            # Update date
-            self.current_date += timedelta(days=self.time_scale)
+        # Update date
+        self.current_date += timedelta(days=self.time_scale)
 
-            # Update GUI in main thread
-            self.root.after(0, self.update_gui)
-            time.sleep(0.05)  # ~20 FPS
+        self.update_gui()
+        self._tick_id = self.root.after(50, self._tick)  # ~20 FPS
 
     def update_gui(self):
-        """Update GUI elements (called from main thread)"""
-        self.date_label.config(text=self.current_date.strftime("%Y-%m-%d"))
+        """Update GUI elements for the current frame"""
+        self.update_date_label()
         self.draw_solar_system()
 
-    def draw_solar_system(self):
-        """Draw the entire solar system"""
-        self.canvas.delete("all")
-
-        # Draw starfield background
-        self.draw_starfield()
+    def update_date_label(self):
+        """Show the current date, touching the label only when the day actually changes"""
+        day = self.current_date.date()
+        if day != self._last_date:
+            self._last_date = day
+            self.date_label.config(text=day.strftime("%Y-%m-%d"))
+
+    def project_positions(self):
+        """Screen x and y arrays of every planet and moon, indexed like the orbit state"""
+        state = self._orbit_state
+        screen_x = self.center_x + state['xs'] * self.zoom_factor
+        screen_y = self.center_y + state['ys'] * self.zoom_factor
+        if self.show_3d:
+            screen_y += state['zs'] * self.depth_factor * self.zoom_factor  # Moons have z = 0
+        return screen_x, screen_y
 
-        # Draw orbits
+    def draw_solar_system(self):
+        """Draw the entire solar system, updating retained canvas items in place"""
+        self._dirty = False
+        rebuilt = False
+        screen_x, screen_y = (coords.tolist() for coords in self.project_positions())
+        view = (self._canvas_w, self._canvas_h)
+
+        # The starfield is only touched by on_canvas_configure
+        # Draw orbits (moved on pan, scaled on zoom, rebuilt only on 3D toggle)
         if self.show_orbits:
-            self.draw_orbits()
+            rebuilt |= self._sync_layer(('orbit',), (self.show_3d, self.zoom_factor),
+                                        (self.center_x, self.center_y), self.draw_orbits, self.resize_orbits)
 
         # Draw Sun
-        self.draw_sun()
+        rebuilt |= self._sync_layer(('sun',), (self.zoom_factor, self.show_names),
+                                    (self.center_x, self.center_y), self.draw_sun)
 
         # Draw planets (sorted by z-coordinate for proper 3D layering)
-        planets_sorted = sorted(self.planets, key=lambda p: p.z if self.show_3d else 0)
+        planets_sorted = [self.planets[i] for i in self._zorder] if self.show_3d else self.planets
         for planet in planets_sorted:
-            self.draw_planet(planet)
+            x = screen_x[planet._index]
+            y = screen_y[planet._index]
+            radius = planet.radius * self.zoom_factor
+            has_shadow = bool(self.show_3d and planet.z > 0)
+            # Rings reach 1.8 radii out and the name sits below the planet
+            if self._in_view(f'planet:{planet.name}', x, y, radius * 2 + 24, view):
+                rebuilt |= self._sync_layer(
+                    (f'planet:{planet.name}',), (self.planet_layout(planet, radius, has_shadow), radius), (x, y),
+                    lambda tags: self.draw_planet(planet, x, y, radius, tags),
+                    lambda: self.resize_planet(planet, x, y, radius)
+                )
 
             # Draw moons
             if self.show_moons:
                 for moon in planet.moon_objects:
-                    self.draw_moon(moon)
-
-    def draw_starfield(self):
-        """Draw background stars"""
-        canvas_width = self.canvas.winfo_width()
-        canvas_height = self.canvas.winfo_height()
-
-        # Use deterministic random seed for consistent star positions
-        random.seed(42)
-        for _ in range(100):
-            x = random.randint(0, canvas_width)
-            y = random.randint(0, canvas_height)
-            brightness = random.uniform(0.3, 1.0)
-            color = self.mix_colors('#FFFFFF', '#000033', brightness)
-            size = random.choice([1, 1, 1, 2])  # Mostly small stars
-            self.canvas.create_oval(x, y, x + size, y + size, fill=color, outline=color)
-
-    def draw_orbits(self):
-        """Draw planetary orbits"""
-        for planet in self.planets:
-            orbit_radius = planet.distance_from_sun * self.zoom_factor
-            if self.show_3d:
-                # Draw elliptical orbit for 3D view
-                inclination_factor = math.cos(math.radians(planet.orbital_inclination))
-                self.canvas.create_oval(
-                    self.center_x - orbit_radius,
-                    self.center_y - orbit_radius * inclination_factor,
-                    self.center_x + orbit_radius,
-                    self.center_y + orbit_radius * inclination_factor,
-                    outline='#444444',
-                    width=1
-                )
-            else:
-                # Draw circular orbit for 2D view
-                self.canvas.create_oval(
-                    self.center_x - orbit_radius,
-                    self.center_y - orbit_radius,
-                    self.center_x + orbit_radius,
-                    self.center_y + orbit_radius,
-                    outline='#444444',
-                    width=1
-                )
+                    moon_x = screen_x[moon._index]
+                    moon_y = screen_y[moon._index]
+                    moon_radius = max(moon.radius * self.zoom_factor, 1)
+                    # The name sits below the moon and reaches up to ~30 px to either side
+                    if self._in_view(f'moon:{moon.name}', moon_x, moon_y, moon_radius + 32, view):
+                        rebuilt |= self._sync_layer(
+                            (f'moon:{moon.name}', 'moon'),
+                            (self.show_names and moon_radius > 2, moon_radius), (moon_x, moon_y),
+                            lambda tags: self.draw_moon(moon, moon_x, moon_y, moon_radius, tags),
+                            lambda: self.resize_moon(moon, moon_x, moon_y, moon_radius)
+                        )
+
+        # Hide or show whole layers when their toggles change
+        for tag, visible in (('orbit', self.show_orbits), ('moon', self.show_moons)):
+            if self._shown.get(tag) != visible:
+                self.canvas.itemconfigure(tag, state=tk.NORMAL if visible else tk.HIDDEN)
+                self._shown[tag] = visible
+
+        if rebuilt or planets_sorted != self._stack_order:
+            self.restack_layers(planets_sorted)
+
+    def _sync_layer(self, tags, key, position, build, resize=None):
+        """Bring a retained canvas layer up to date; returns True if it had to be rebuilt
+
+        A layer is the group of items sharing the tag tags[0]. If its shape key is
+        unchanged the items are only moved to the new position. Layers that can be
+        resized use a (layout, size) key: when only the size differs, resize()
+        updates the existing items in place. Otherwise the items are deleted and
+        build(tags) recreates them at the current position.
+        """
+        tag = tags[0]
+        entry = self._canvas_ids.get(tag)
+        if entry is not None and entry[0] == key:
+            old_x, old_y = entry[1]
+            if position[0] != old_x or position[1] != old_y:
+                self.canvas.move(tag, position[0] - old_x, position[1] - old_y)
+                self._canvas_ids[tag] = (key, position)
+            return False
+
+        if entry is not None and resize is not None and entry[0][0] == key[0]:
+            resize()
+            self._canvas_ids[tag] = (key, position)
+            return False
+
+        for item in self.canvas.find_withtag(tag):
+            self._item_sprites.pop(item, None)
+        self.canvas.delete(tag)
+        build(tags)
+        self._canvas_ids[tag] = (key, position)
+        return True
+
+    def _in_view(self, tag, x, y, extent, view):
+        """Whether a layer centered at (x, y) needs syncing for a canvas of size view
+
+        A layer that leaves the canvas is synced once more, so its items end up
+        off-screen, and is then skipped until it comes back within extent pixels.
+        """
+        if -extent < x < view[0] + extent and -extent < y < view[1] + extent:
+            self._culled.discard(tag)
+            return True
+        if tag in self._culled:
+            return False
+        self._culled.add(tag)
+        return True
+
+    def restack_layers(self, planets_sorted):
+        """Restore drawing order: stars, orbits, Sun, then planets back to front with their moons"""
+        for tag in ('stars', 'orbit', 'sun'):
+            self.canvas.tag_raise(tag)
+        for planet in planets_sorted:
+            self.canvas.tag_raise(f'planet:{planet.name}')
+            # Moons one by one, as a single one may have been rebuilt on top of its siblings
+            for moon in planet.moon_objects:
+                self.canvas.tag_raise(f'moon:{moon.name}')
+        self._stack_order = planets_sorted
+
+    def on_canvas_configure(self, event):
+        """Remember the new canvas size, rebuild the starfield for it and redraw"""
+        self._canvas_w, self._canvas_h = size = (event.width, event.height)
+        if self._sync_layer(('stars',), size, (0, 0), lambda tags: self.draw_starfield(size, tags)):
+            self.canvas.tag_lower('stars')
+        # Culled layers were parked just past the old edge; sync each once against the new size
+        self._culled.clear()
+        self._schedule_redraw()
+
+    def get_stars(self, size):
+        """Get the star (x, y, size, color) tuples for a canvas of the given size"""
+        stars = self._star_cache.get(size)
+        if stars is None:
+            canvas_width, canvas_height = size
+
+            # Use deterministic random seed for consistent star positions
+            random.seed(42)
+            stars = []
+            for _ in range(100):
+                x = random.randint(0, canvas_width)
+                y = random.randint(0, canvas_height)
+                brightness = random.uniform(0.3, 1.0)
+                color = self.mix_colors('#FFFFFF', '#000033', brightness)
+                star_size = random.choice([1, 1, 1, 2])  # Mostly small stars
+                stars.append((x, y, star_size, color))
+            self._star_cache[size] = stars
+        return stars
+
+    def draw_starfield(self, size, tags):
+        """Draw background stars into an offscreen image and blit it as a single canvas item"""
+        # Transparent buffer so the theme's canvas background shows through
+        starfield = Image.new('RGBA', size, (0, 0, 0, 0))
+        draw = ImageDraw.Draw(starfield)
+        for x, y, star_size, color in self.get_stars(size):
+            draw.ellipse((x, y, x + star_size, y + star_size), fill=color, outline=color)
+
+        self._starfield_photo = self.make_photo(starfield)
+        self.canvas.create_image(0, 0, anchor='nw', image=self._starfield_photo, tags=tags)
+
+    def draw_orbits(self, tags):
+        """Draw planetary orbits from their precomputed polylines"""
+        center = (self.center_x, self.center_y)
+        for path in self._orbit_paths[self.show_3d]:
+            points = path * self.zoom_factor + center
+            self.canvas.create_line(
+                points.ravel().tolist(),
+                fill='#444444',
+                width=1,
+                smooth=True,
+                tags=tags
+            )
+
+    def resize_orbits(self):
+        """Move and scale the existing orbit polylines to the current center and zoom"""
+        (_, old_zoom), (old_x, old_y) = self._canvas_ids['orbit']
+        self.canvas.move('orbit', self.center_x - old_x, self.center_y - old_y)
+        factor = self.zoom_factor / old_zoom
+        self.canvas.scale('orbit', self.center_x, self.center_y, factor, factor)
 
-    def draw_sun(self):
+    def draw_sun(self, tags):
         """Draw the Sun at the center"""
         sun_radius = 20 * self.zoom_factor
         if self.sun_image:
@@ -1409,7 +1869,8 @@ class SolarSystemExplorer:
                 self.canvas.create_image(
                     self.center_x,
                     self.center_y,
-                    image=self.sun_image
+                    image=self.sun_image,
+                    tags=tags
                 )
             except:
                 # Fallback to circle
@@ -1420,21 +1881,19 @@ class SolarSystemExplorer:
                     self.center_y + sun_radius,
                     fill='#FFD700',
                     outline='#FFA500',
-                    width=2
+                    width=2,
+                    tags=tags
                 )
         else:
-            # Draw sun as gradient circle
-            for i in range(int(sun_radius), 0, -2):
-                intensity = 1.0 - (sun_radius - i) / sun_radius
-                color = self.mix_colors('#FFD700', '#FFA500', intensity)
-                self.canvas.create_oval(
-                    self.center_x - i,
-                    self.center_y - i,
-                    self.center_x + i,
-                    self.center_y + i,
-                    fill=color,
-                    outline=color
+            # Draw sun as gradient circle, orange at the center to gold at the rim
+            size = max(round(sun_radius) * 2, 2)
+            sprite = self.get_sprite(
+                ('sun', size),
+                lambda: self.get_radial_gradient('#FFD700', '#FFA500', 0.0, 1.0).resize(
+                    (size, size), Image.Resampling.BILINEAR
                 )
+            )
+            self.create_sprite(self.center_x, self.center_y, sprite, tags)
 
         # Sun label
         if self.show_names:
@@ -1443,147 +1902,290 @@ class SolarSystemExplorer:
                 self.center_y + sun_radius + 15,
                 text="Sun",
                 fill='#FFD700',
-                font=("Arial", 10, "bold")
+                font=("Arial", 10, "bold"),
+                tags=tags
             )
 
-    def draw_planet(self, planet):
-        """Draw a planet"""
-        # Calculate screen position
-        x = self.center_x + planet.x * self.zoom_factor
-        y = self.center_y + planet.y * self.zoom_factor
-        if self.show_3d:
-            y += planet.z * self.depth_factor * self.zoom_factor
-        radius = planet.radius * self.zoom_factor
+    def planet_layout(self, planet, radius, has_shadow):
+        """Describe which items draw_planet creates, so zooming can resize them instead of rebuilding"""
+        if planet.photo_image and radius > 5:
+            body = 'sprite'
+        elif self.show_3d:
+            body = 'shaded'
+        else:
+            body = 'circle'
+        return (body, has_shadow, planet.has_rings and radius > 8, self.show_3d, self.show_names)
+
+    def draw_planet(self, planet, x, y, radius, tags):
+        """Draw a planet at screen position (x, y), keeping the item ids for resize_planet"""
+        self._coarse_sprites.pop(planet.name, None)
 
         # Draw planet shadow for 3D effect
+        planet._shadow_id = None
         if self.show_3d and planet.z > 0:
-            shadow_offset = 3
-            self.canvas.create_oval(
-                x - radius + shadow_offset,
-                y - radius + shadow_offset,
-                x + radius + shadow_offset,
-                y + radius + shadow_offset,
-                fill='#000000',
-                outline='',
-                stipple='gray50'
+            planet._shadow_id = self.create_sprite(
+                x + self._SHADOW_OFFSET, y + self._SHADOW_OFFSET, self.get_shadow_sprite(radius), tags
             )
 
         # Draw planet
         if planet.photo_image and radius > 5:
             # Scale image to current zoom level
             try:
-                if planet.image:
-                    scaled_size = max(int(radius * 2), 10)
-                    scaled_img = planet.image.resize((scaled_size, scaled_size),
-                                                     Image.Resampling.LANCZOS)
-                    scaled_photo = ImageTk.PhotoImage(scaled_img)
-                    # Store reference to prevent garbage collection
-                    planet.current_photo = scaled_photo
-                    self.canvas.create_image(x, y, image=scaled_photo)
-                else:
-                    self.canvas.create_image(x, y, image=planet.photo_image)
+                planet._canvas_id = self.create_sprite(x, y, self.get_planet_sprite(planet, radius), tags)
             except:
                 # Fallback to colored circle
-                self.draw_planet_circle(planet, x, y, radius)
+                planet._canvas_id = self.draw_planet_circle(planet, x, y, radius, tags)
         else:
             # Draw as colored circle
-            self.draw_planet_circle(planet, x, y, radius)
+            planet._canvas_id = self.draw_planet_circle(planet, x, y, radius, tags)
 
         # Draw rings if planet has them
+        planet._ring_id = None
         if planet.has_rings and radius > 8:
-            self.draw_rings(planet, x, y, radius)
+            planet._ring_id = self.draw_rings(planet, x, y, radius, tags)
 
         # Draw planet name
+        planet._label_id = None
         if self.show_names:
-            name_y = y + radius + 12
-            self.canvas.create_text(
-                x, name_y,
+            planet._label_id = self.canvas.create_text(
+                x, y + radius + 12,
                 text=planet.name,
                 fill='white',
-                font=("Arial", 8, "bold")
+                font=("Arial", 8, "bold"),
+                tags=tags
             )
 
-    def draw_planet_circle(self, planet, x, y, radius):
-        """Draw planet as a colored circle with 3D shading"""
+    def resize_planet(self, planet, x, y, radius):
+        """Move and resize the items draw_planet created for the same layout"""
+        if planet._shadow_id is not None:
+            self.canvas.coords(planet._shadow_id, x + self._SHADOW_OFFSET, y + self._SHADOW_OFFSET)
+            self.show_sprite(planet._shadow_id, self.get_shadow_sprite(radius))
+        if planet.photo_image and radius > 5:
+            self.canvas.coords(planet._canvas_id, x, y)
+            self.show_sprite(planet._canvas_id, self.get_planet_sprite(planet, radius))
+        elif self.show_3d:
+            self.canvas.coords(planet._canvas_id, x, y)
+            self.show_sprite(planet._canvas_id, self.get_shaded_sprite(planet.color, radius))
+        else:
+            self.canvas.coords(planet._canvas_id, x - radius, y - radius, x + radius, y + radius)
+        if planet._ring_id is not None:
+            self.canvas.coords(planet._ring_id, x, y)
+            self.show_sprite(planet._ring_id, self.get_ring_sprite(planet, radius))
+        if planet._label_id is not None:
+            self.canvas.coords(planet._label_id, x, y + radius + 12)
+
+    def get_planet_sprite(self, planet, radius):
+        """Get the planet's PhotoImage scaled to the given on-screen radius"""
+        if not planet.image:
+            return planet.photo_image
+        # 4-pixel size steps, so a slow zoom reuses each sprite for a few frames
+        size = max(round(radius / 2) * 4, 12)
+
+        sprite = self.get_sprite((planet.name, size, Image.Resampling.LANCZOS))
+        if sprite is not None:
+            self._coarse_sprites.pop(planet.name, None)
+            return sprite
+
+        # Resample cheaply while zooming; refine_sprites swaps in LANCZOS once it stops
+        self._coarse_sprites[planet.name] = (planet, size)
+        if self._refine_after is not None:
+            self.root.after_cancel(self._refine_after)
+        self._refine_after = self.root.after(250, self.refine_sprites)
+        return self.get_sprite(
+            (planet.name, size, Image.Resampling.BILINEAR),
+            lambda: planet.image.resize((size, size), Image.Resampling.BILINEAR)
+        )
+
+    def refine_sprites(self):
+        """Redraw the sprites that were resampled with BILINEAR during zooming using LANCZOS"""
+        self._refine_after = None
+        for planet, size in self._coarse_sprites.values():
+            sprite = self.get_sprite(
+                (planet.name, size, Image.Resampling.LANCZOS),
+                lambda: planet.image.resize((size, size), Image.Resampling.LANCZOS)
+            )
+            self.show_sprite(planet._canvas_id, sprite)
+        self._coarse_sprites.clear()
+
+    def make_photo(self, image):
+        """Wrap a PIL image in a PhotoImage, remembering the source for render_canvas_image"""
+        photo = ImageTk.PhotoImage(image)
+        name = str(photo)
+        self._photo_sources[name] = image
+        weakref.finalize(photo, self._photo_sources.pop, name, None)
+        return photo
+
+    def create_sprite(self, x, y, sprite, tags):
+        """Create an image item centered at (x, y) showing sprite; returns its id"""
+        item = self.canvas.create_image(x, y, image=sprite, tags=tags)
+        self._item_sprites[item] = sprite
+        return item
+
+    def show_sprite(self, item, sprite):
+        """Point an existing image item at sprite, releasing the one it showed before"""
+        self.canvas.itemconfigure(item, image=sprite)
+        self._item_sprites[item] = sprite
+
+    def get_sprite(self, key, render=None):
+        """Get the cached PhotoImage for key, rendering its PIL image on first use
+
+        Without render, only an already cached sprite is returned (or None).
+        """
+        sprite = self._sprite_cache.get(key)
+        if sprite is not None:
+            self._sprite_cache.move_to_end(key)
+        elif render is not None:
+            sprite = self.make_photo(render())
+            self._sprite_cache[key] = sprite
+            if len(self._sprite_cache) > self._SPRITE_CACHE_LIMIT:
+                self._sprite_cache.popitem(last=False)
+        return sprite
+
+    def get_shaded_sprite(self, color, radius):
+        """Get a circle of the given color, darkening from 100% at the center to 40% at the rim"""
+        size = max(round(radius) * 2, 2)
+        return self.get_sprite(
+            ('shaded', color, size),
+            lambda: self.get_radial_gradient(color, '#000000', 1.0, 0.4).resize(
+                (size, size), Image.Resampling.BILINEAR
+            )
+        )
+
+    def get_radial_gradient(self, color1, color2, center_ratio, edge_ratio):
+        """Get a filled circle image blending mix_colors(color1, color2, ratio) from center to edge
+
+        The ratio runs linearly with the distance from the center, and the image
+        is transparent outside the circle.
+        """
+        key = (color1, color2, center_ratio, edge_ratio)
+        gradient = self._shaded_sprites.get(key)
+        if gradient is None:
+            size = self._GRADIENT_SIZE
+            distance = self.radial_distance(size)
+
+            ratio = (center_ratio + (edge_ratio - center_ratio) * np.minimum(distance, 1.0))[..., None]
+            pixels = np.empty((size, size, 4), dtype=np.uint8)
+            pixels[..., :3] = np.array(hex_to_rgb(color1)) * ratio + np.array(hex_to_rgb(color2)) * (1 - ratio)
+            pixels[..., 3] = np.where(distance <= 1.0, 255, 0)
+
+            gradient = Image.fromarray(pixels, 'RGBA')
+            self._shaded_sprites[key] = gradient
+        return gradient
+
+    def radial_distance(self, size):
+        """Distance of each pixel center from the middle of a size x size image, 1.0 at the edge"""
+        half = size / 2
+        yy, xx = np.mgrid[0:size, 0:size]
+        return np.hypot(xx + 0.5 - half, yy + 0.5 - half) / half
+
+    def get_shadow_sprite(self, radius):
+        """Get a half-transparent black disc with a soft rim, shared by every planet's 3D shadow"""
+        size = max(round(radius) * 2, 2)
+        return self.get_sprite(('shadow', size), lambda: self.get_shadow_image().resize(
+            (size, size), Image.Resampling.BILINEAR
+        ))
+
+    def get_shadow_image(self):
+        """Get the full-resolution shadow disc the scaled shadow sprites are made from"""
+        shadow = self._shaded_sprites.get('shadow')
+        if shadow is None:
+            size = self._GRADIENT_SIZE
+            # 50% black like the old gray50 stipple, fading out over the outer 15% of the radius
+            alpha = 128 * np.clip((1.0 - self.radial_distance(size)) / 0.15, 0.0, 1.0)
+            pixels = np.zeros((size, size, 4), dtype=np.uint8)
+            pixels[..., 3] = alpha
+            shadow = Image.fromarray(pixels, 'RGBA')
+            self._shaded_sprites['shadow'] = shadow
+        return shadow
+
+    def draw_planet_circle(self, planet, x, y, radius, tags):
+        """Draw planet as a colored circle with 3D shading; returns the circle's item id"""
         if self.show_3d:
             # Draw 3D shaded circle
-            for i in range(int(radius), 0, -1):
-                # Calculate shading based on distance from center
-                intensity = 0.4 + 0.6 * (radius - i) / radius
-                shaded_color = self.mix_colors(planet.color, '#000000', intensity)
-                self.canvas.create_oval(
-                    x - i, y - i,
-                    x + i, y + i,
-                    fill=shaded_color,
-                    outline=shaded_color
-                )
+            return self.create_sprite(x, y, self.get_shaded_sprite(planet.color, radius), tags)
         else:
             # Draw simple colored circle
-            self.canvas.create_oval(
+            return self.canvas.create_oval(
                 x - radius, y - radius,
                 x + radius, y + radius,
                 fill=planet.color,
                 outline='white',
-                width=1
+                width=1,
+                tags=tags
             )
 
-    def draw_rings(self, planet, x, y, radius):
-        """Draw planet rings"""
+    def draw_rings(self, planet, x, y, radius, tags):
+        """Draw planet rings as a single image item; returns its id"""
+        return self.create_sprite(x, y, self.get_ring_sprite(planet, radius), tags)
+
+    def get_ring_sprite(self, planet, radius):
+        """Get the planet's rings for the current view, one sprite per whole-pixel radius"""
+        radius = round(radius)
+        return self.get_sprite(
+            ('rings', planet.name, self.show_3d, radius),
+            lambda: self.render_rings(planet.color, radius, self.show_3d)
+        )
+
+    def render_rings(self, color, radius, flattened):
+        """Render three ring bands around a planet of the given radius into a transparent image"""
         ring_outer = radius * 1.8
         ring_inner = radius * 1.3
         ring_thickness = 3
 
+        half_width = ring_outer + ring_thickness
+        half_height = (ring_outer * 0.2 if flattened else ring_outer) + ring_thickness
+        rings = Image.new('RGBA', (math.ceil(half_width * 2), math.ceil(half_height * 2)), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(rings)
+        cx, cy = rings.width / 2, rings.height / 2
+
         # Draw multiple ring bands
         for i, alpha in enumerate([0.8, 0.6, 0.4]):
             ring_radius = ring_inner + (ring_outer - ring_inner) * (i + 1) / 3
-            ring_color = self.mix_colors('#CCCCCC', planet.color, alpha)
+            ring_color = self.mix_colors('#CCCCCC', color, alpha)
 
             # Draw ring as flattened ellipse for 3D effect
-            if self.show_3d:
-                ring_height = ring_radius * 0.2  # Flattened for perspective
-                self.canvas.create_oval(
-                    x - ring_radius, y - ring_height,
-                    x + ring_radius, y + ring_height,
-                    outline=ring_color,
-                    width=ring_thickness
-                )
-            else:
-                self.canvas.create_oval(
-                    x - ring_radius, y - ring_radius,
-                    x + ring_radius, y + ring_radius,
-                    outline=ring_color,
-                    width=ring_thickness
-                )
-
-    def draw_moon(self, moon):
-        """Draw a moon"""
-        moon_radius = moon.radius * self.zoom_factor
-        if moon_radius < 1:
-            moon_radius = 1
-
-        x = self.center_x + moon.x * self.zoom_factor
-        y = self.center_y + moon.y * self.zoom_factor
+            ring_height = ring_radius * 0.2 if flattened else ring_radius
+
+            # Tk centers an oval's outline on its bounds, ImageDraw draws it inside them
+            pad = ring_thickness / 2
+            draw.ellipse(
+                (cx - ring_radius - pad, cy - ring_height - pad, cx + ring_radius + pad, cy + ring_height + pad),
+                outline=ring_color,
+                width=ring_thickness
+            )
+        return rings
 
+    def draw_moon(self, moon, x, y, moon_radius, tags):
+        """Draw a moon at screen position (x, y), keeping the item ids for resize_moon"""
         # Draw moon
-        self.canvas.create_oval(
+        moon._canvas_id = self.canvas.create_oval(
             x - moon_radius,
             y - moon_radius,
             x + moon_radius,
             y + moon_radius,
             fill=moon.color,
             outline='white',
-            width=1
+            width=1,
+            tags=tags
         )
 
         # Draw moon name for larger moons
+        moon._label_id = None
         if self.show_names and moon_radius > 2:
-            self.canvas.create_text(
+            moon._label_id = self.canvas.create_text(
                 x, y + moon_radius + 8,
                 text=moon.name,
                 fill='#CCCCCC',
-                font=("Arial", 7)
+                font=("Arial", 7),
+                tags=tags
             )
 
+    def resize_moon(self, moon, x, y, moon_radius):
+        """Move and resize the items draw_moon created for the same layout"""
+        self.canvas.coords(moon._canvas_id, x - moon_radius, y - moon_radius, x + moon_radius, y + moon_radius)
+        if moon._label_id is not None:
+            self.canvas.coords(moon._label_id, x, y + moon_radius + 8)
+
     def run(self):
         """Start the application"""
         self.root.mainloop()